@@ -7,7 +7,7 @@
 ##  @file   attrWidgets.py
 #   @brief  Pyside widgets for attribute controls within Maya. 
 #       ---- Each Widget has the ability to connect to a plug and be driven, or drive that attributes value simp[le "setLiveMode" to True
-#       ---- The widgets all emit a "valueChanged" signal when there value is updated
+#       ---- The widgets all emit a "valueChanged" signal carrying the new value when there value is updated
 #       ---- You can steal or set the attributes current data via the "stealMyData" or "pushInData" functions
 #       ---- SpinBox widgets attempt to set their limits based on the soft ranges of the given plugs
 #       ---- Enum or option type attributes should give all there options as available members of a combo box
@@ -22,7 +22,7 @@
 #   or hard copy form.
 #
 
-import sys, os, types
+import sys, os
 import logging, weakref
 
 from PySide2 import QtCore as QtCore
@@ -32,9 +32,13 @@ from PySide2 import QtUiTools
 
 from maya import cmds
 from maya import mel
-from maya import OpenMaya as om
+from maya.api import OpenMaya as om
 from maya import OpenMayaUI as omui 
 
+##  @brief cmds functions called per edit or per refresh, bound once so the hot paths skip the module attribute lookup
+_cmdsGetAttr = cmds.getAttr
+_cmdsSetAttr = cmds.setAttr
+
 ##  @brief create logger object for Module
 _logger = logging.getLogger(__name__)
 _logger.setLevel(logging.WARNING)
@@ -50,6 +54,15 @@ K_FLOAT_WIDGET_STEP_INCREMENT   = 0.01
 #   @note higher factor means more accuracy
 K_FLOAT_WIDGET_FACTOR           = int(100)
 
+##  @brief  Float Attribute Widget interval in milliseconds spinbox edits are coalesced over before being set on the plug
+K_FLOAT_WIDGET_WRITE_INTERVAL   = 16
+
+##  @brief  Float Attribute Widget tolerance under which a scene value is treated as unchanged
+K_FLOAT_VALUE_TOLERANCE         = 1e-7
+
+##  @brief  Interval in milliseconds slider drags are set on the plug at most once over
+K_SLIDER_COMMIT_INTERVAL        = 50
+
 ##  @brief  Integer SpinBox and slider increment
 K_INTEGER_WIDGET_STEP_INCREMENT = 1
 
@@ -72,9 +85,49 @@ K_FLOAT_ATTR_DEFAULTS   =   {
 ##  @brief  String attribute Widget default values
 K_STRING_ATTR_DEFAULTS  = {'value':''}
 
+##  @brief  Interval in milliseconds dirty plug refreshes are coalesced over, roughly one frame
+K_REFRESH_INTERVAL      = 16
+
+##  @brief  Number of attribute widgets AttributeWidgetBuilder creates per event loop pass
+K_WIDGET_BUILD_BATCH_SIZE = 8
+
+##  @brief  Layout margins shared by every attribute widget
+_ZERO_MARGINS = QtCore.QMargins(0, 0, 0, 0)
+
+##  @brief  Size policy shared by every attribute widget, stretch horizontally and keep a fixed height
+_SIZE_POLICY_PREF_FIXED = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+
 ##  @brief storage key for override nodes plug {ovrNode}.{attr}
 K_OVR_PLUG_OVERRIDE_DATA_KEYS           = 'overridePlug'
 
+##  @brief cmds attribute type strings for OpenMaya numeric and unit attribute types
+_NUMERIC_ATTR_TYPES = {
+                        om.MFnNumericData.kDouble:  'double',
+                        om.MFnNumericData.kFloat:   'float',
+                        om.MFnNumericData.kInt:     'long',
+                        om.MFnNumericData.kShort:   'short',
+                        om.MFnNumericData.kByte:    'byte',
+                        om.MFnNumericData.kBoolean: 'bool',
+                        }
+_UNIT_ATTR_TYPES    = {
+                        om.MFnUnitAttribute.kDistance:  'doubleLinear',
+                        om.MFnUnitAttribute.kAngle:     'doubleAngle',
+                        om.MFnUnitAttribute.kTime:      'time',
+                        }
+
+##  @brief Widgets with a dirty plug waiting for the next deferred refresh
+_pendingWidgets = weakref.WeakSet()
+
+##  @brief Single shot timer draining _pendingWidgets, created on first use by _scheduleRefresh
+_refreshTimer = None
+
+##  @brief Plug writes waiting for the next flush, {plugString: (setter, value)}
+_pendingWrites = dict()
+_flushScheduled = False
+
+##  @brief ids of the widgets that currently hold an open undo chunk, see _closeUndoChunkForOwner
+_undoChunkOwners = set()
+
 
 ##  @brief Splits a node.plug string and returns the node part only
 #
@@ -117,11 +170,194 @@ def _getDependNode(nodeName):
     """
     dependNode = om.MObject()
     selList = om.MSelectionList()
-    selList.add(nodeName)
+    try:
+        selList.add(nodeName)
+    except RuntimeError:
+        return dependNode
     if selList.length() > 0: 
-        selList.getDependNode(0, dependNode)
+        dependNode = selList.getDependNode(0)
     return dependNode
 
+##  @brief Builds a dirty plug callback that only holds a weak reference to the widget,
+#   so Maya's callback table does not keep closed widgets alive
+#
+#   @param weakWidget [weakref.ref] - weak reference to the attribute widget
+#
+def _weakDirtyPlugCallback(weakWidget):
+    def _callback(node, plug, *args, **kwargs):
+        _widget = weakWidget()
+        if _widget is not None:
+            _widget._onDirtyPlug(node, plug, *args, **kwargs)
+    return _callback
+
+##  @brief Connects a signal to a slot only once, so calling _setupSocketConnections again
+#   does not stack duplicate connections that each trigger a setAttr
+#
+def _uniqueConnect(signal, slot):
+    try:
+        signal.connect(slot, QtCore.Qt.UniqueConnection)
+    except (TypeError, RuntimeError):
+        #NOTE: Already connected
+        pass
+
+##  @brief Returns the attribute type string of a plug, as cmds.getAttr(type=True) would,
+#   for the attribute types the widgets support. None for anything else
+#
+#   @note   Unit attributes are reported by unit only, float unit attributes come back as their double
+#       counterpart: "floatLinear" as "doubleLinear" and "floatAngle" as "doubleAngle", 
+#       where cmds.getAttr(type=True) keeps them apart. The widgets read and write both the same way, 
+#       so a widget built from a plug accepts float unit attributes that the cmds path rejects
+#
+def _getPlugAttributeType(plug):
+    _attrObj = plug.attribute()
+    if _attrObj.hasFn(om.MFn.kEnumAttribute):
+        return 'enum'
+    if _attrObj.hasFn(om.MFn.kUnitAttribute):
+        return _UNIT_ATTR_TYPES.get(om.MFnUnitAttribute(_attrObj).unitType(), None)
+    if _attrObj.hasFn(om.MFn.kNumericAttribute):
+        return _NUMERIC_ATTR_TYPES.get(om.MFnNumericAttribute(_attrObj).numericType(), None)
+    if _attrObj.hasFn(om.MFn.kTypedAttribute):
+        if om.MFnTypedAttribute(_attrObj).attrType() == om.MFnData.kString:
+            return 'string'
+    return None
+
+##  @brief Converts an OpenMaya unit value (MDistance, MAngle, MTime) into the current UI units,
+#   matching what cmds.getAttr and cmds.attributeQuery return. Plain numeric values are returned as is
+#
+def _asUiUnits(value):
+    if isinstance(value, (om.MDistance, om.MAngle, om.MTime)):
+        return value.asUnits(value.uiUnit())
+    return value
+
+##  @brief Reads the value of a plug directly through OpenMaya, without a MEL round trip
+#
+#   @param plug [MPlug] - plug to read
+#   @param attributeType [str] - attribute type string as returned by cmds.getAttr(type=True)
+#
+#   @retval value of the plug in UI units
+#
+def _getPlugValue(plug, attributeType):
+    if attributeType == 'doubleLinear':
+        return _asUiUnits(plug.asMDistance())
+    if attributeType == 'doubleAngle':
+        return _asUiUnits(plug.asMAngle())
+    if attributeType == 'time':
+        return _asUiUnits(plug.asMTime())
+    if attributeType in ('double', 'float'):
+        return plug.asDouble()
+    if attributeType == 'string':
+        return plug.asString()
+    if attributeType == 'bool':
+        return plug.asBool()
+    return plug.asInt()
+
+##  @brief Fills in the minimum, maximum and softRange keys of the given attribute data 
+#   from the numeric/unit attribute function set of the plug
+#
+#   @param attrData [dict] - attribute data to update, must already contain a "softRange" key
+#   @param plug [MPlug] - plug to query
+#
+def _updateRangeInformation(attrData, plug):
+    _attrObj = plug.attribute()
+    if _attrObj.hasFn(om.MFn.kUnitAttribute):
+        _fnAttr = om.MFnUnitAttribute(_attrObj)
+    elif _attrObj.hasFn(om.MFn.kNumericAttribute):
+        _fnAttr = om.MFnNumericAttribute(_attrObj)
+    else:
+        return attrData
+
+    if _fnAttr.hasMin():
+        attrData['minimum'] = _asUiUnits(_fnAttr.getMin())
+
+    if _fnAttr.hasMax():
+        attrData['maximum'] = _asUiUnits(_fnAttr.getMax())
+
+    ##NOTE: Use this to limit the slider ranges
+    if _fnAttr.hasSoftMin() or _fnAttr.hasSoftMax():
+        _softRange = list(attrData['softRange'])
+        if _fnAttr.hasSoftMin():
+            _softRange[0] = _asUiUnits(_fnAttr.getSoftMin())
+        if _fnAttr.hasSoftMax():
+            _softRange[1] = _asUiUnits(_fnAttr.getSoftMax())
+        attrData['softRange'] = _softRange
+    return attrData
+
+##  @brief Returns the field names of an enum plug ordered by their field index
+#
+def _getEnumFieldNames(plug):
+    _fnEnum = om.MFnEnumAttribute(plug.attribute())
+    _fieldNames = list()
+    for _idx in range(_fnEnum.getMin(), _fnEnum.getMax() + 1):
+        try:
+            _fieldNames.append(_fnEnum.fieldName(_idx))
+        except RuntimeError:
+            continue
+    return _fieldNames
+
+##  @brief Deferred drain of all widgets flagged by their dirty plug callbacks, 
+#   a single refresh services every widget dirtied during the same interval
+#
+def _processPendingWidgets():
+    _widgets = list(_pendingWidgets)
+    _pendingWidgets.clear()
+    for _widget in _widgets:
+        _widget._processDeferredUpdateRequest()
+
+##  @brief Starts the shared refresh timer if it is not already running,
+#   any dirty plug landing inside the interval is absorbed by the same refresh
+#
+def _scheduleRefresh():
+    global _refreshTimer
+    if _refreshTimer is None:
+        _refreshTimer = QtCore.QTimer()
+        _refreshTimer.setSingleShot(True)
+        _refreshTimer.setInterval(K_REFRESH_INTERVAL)
+        _refreshTimer.timeout.connect(_processPendingWidgets)
+    if not _refreshTimer.isActive():
+        _refreshTimer.start()
+
+##  @brief Queues a plug write, later writes to the same plug replace earlier ones.
+#   All queued writes are set together by _flushWrites on the next event loop pass
+#
+#   @param plugString [str] - MayaNode.attribute to set
+#   @param setter [callable] - called as setter(plugString, value) to set the plug
+#   @param value - value to set
+#
+def _queueWrite(plugString, setter, value):
+    global _flushScheduled
+    _pendingWrites[plugString] = (setter, value)
+    if not _flushScheduled:
+        _flushScheduled = True
+        QtCore.QTimer.singleShot(0, _flushWrites)
+
+##  @brief Sets every queued plug write in one pass
+#
+def _flushWrites():
+    global _flushScheduled
+    _flushScheduled = False
+    _writes = list(_pendingWrites.items())
+    _pendingWrites.clear()
+    for _plugString, (_setter, _val) in _writes:
+        try:
+            _setter(_plugString, _val)
+        except Exception as err:
+            _logger.warning(err)
+            _logger.info('Unable to set node attribute in file, Slider for "%s" is now out of sync', _plugString)
+            #NOTE: we can't restore the scene value to the widget here without causing a terrible loop
+
+##  @brief Closes the undo chunk opened by a widget, if it still has one open.
+#   Keyed by id so it can also run from the destroyed signal, once the widget itself is gone
+#
+#   @param ownerId [int] - id() of the widget that opened the chunk
+#
+def _closeUndoChunkForOwner(ownerId, *args):
+    if ownerId not in _undoChunkOwners:
+        return
+    _undoChunkOwners.discard(ownerId)
+    #NOTE: Queued writes belong to the chunk, set them before closing it
+    _flushWrites()
+    cmds.undoInfo(closeChunk=True)
+
 ##  @brief this QComboBox scrolls only if opend before. 
 #   if the mouse is over the QComboBox and the mousewheel is turned,
 #   the mousewheel event of the scrollWidget is triggered
@@ -143,6 +379,7 @@ class CustomQComboBox(QtWidgets.QComboBox):
 ##  @brief this QSlider scrolls only if opend before. 
 #   if the mouse is over the QSlider and the mousewheel is turned,
 #   the mousewheel event of the scrollWidget is triggered
+#   Mouse moves during a drag are compressed, only the latest move per event loop pass is handled by the slider
 #
 class CustomQSlider(QtWidgets.QSlider):
     def __init__(self, scrollWidget=None, *args, **kwargs):
@@ -150,12 +387,49 @@ class CustomQSlider(QtWidgets.QSlider):
         self.scrollWidget=scrollWidget
         self.setFocusPolicy(QtCore.Qt.StrongFocus)
 
+        self._pendingMoveEvent = None
+        self._moveTimer = QtCore.QTimer(self)
+        self._moveTimer.setSingleShot(True)
+        self._moveTimer.setInterval(0)
+        self._moveTimer.timeout.connect(self._processPendingMove)
+
     def wheelEvent(self, *args, **kwargs):
         if self.hasFocus():
             return QtWidgets.QSlider.wheelEvent(self, *args, **kwargs)
         #else:
         #    return self.scrollWidget.wheelEvent(*args, **kwargs)
 
+    def mouseMoveEvent(self, event):
+        #NOTE: Only drags are compressed, hover and tracking moves go straight through
+        if not self.isSliderDown():
+            return QtWidgets.QSlider.mouseMoveEvent(self, event)
+
+        #NOTE: Qt reuses the event once this returns, so keep a copy of the latest move
+        self._pendingMoveEvent = QtGui.QMouseEvent(
+                                                    event.type(), 
+                                                    event.localPos(), 
+                                                    event.windowPos(), 
+                                                    event.screenPos(), 
+                                                    event.button(), 
+                                                    event.buttons(), 
+                                                    event.modifiers()
+                                                    )
+        if not self._moveTimer.isActive():
+            self._moveTimer.start()
+
+    def mouseReleaseEvent(self, event):
+        #NOTE: The release has to land on the last position the mouse moved to
+        self._processPendingMove()
+        return QtWidgets.QSlider.mouseReleaseEvent(self, event)
+
+    def _processPendingMove(self):
+        self._moveTimer.stop()
+        if self._pendingMoveEvent is None:
+            return
+        _event = self._pendingMoveEvent
+        self._pendingMoveEvent = None
+        QtWidgets.QSlider.mouseMoveEvent(self, _event)
+
 ##  @brief this QDoubleSpinBox scrolls only if opend before. 
 #   if the mouse is over the QDoubleSpinBox and the mousewheel is turned,
 #   the mousewheel event of the scrollWidget is triggered
@@ -197,13 +471,22 @@ class CustomQSpinBox(QtWidgets.QSpinBox):
 #
 class BaseAttributeWidget(QtWidgets.QWidget):
 
-    valueChanged = QtCore.Signal()
+    valueChanged = QtCore.Signal(object)
 
-    VALID_ATTR_TYPES = set()
-    ALWAYS_SKIP_PROPERTIES = ['valueChanged', 'staticMetaObject', 'VALID_ATTR_TYPES', 'PUSH_SKIP_PROPERTIES', 'GARBAGE_TEST']
-    PUSH_SKIP_PROPERTIES = ['node','attribute','attributeType','isConnected','plugString']
+    VALID_ATTR_TYPES = frozenset()
+    ALWAYS_SKIP_PROPERTIES = frozenset(['valueChanged', 'staticMetaObject', 'VALID_ATTR_TYPES', 'PUSH_SKIP_PROPERTIES', 'GARBAGE_TEST'])
+    PUSH_SKIP_PROPERTIES = frozenset(['node','attribute','attributeType','isConnected','plugString'])
     GARBAGE_TEST = 'GAdbsdbrhad'
 
+    ##NOTE: Public property names, collected once per class by __init_subclass__
+    _CACHED_PROPS = tuple()
+    _CACHED_PUSH_PROPS = tuple()
+
+    def __init_subclass__(cls, **kwargs):
+        super(BaseAttributeWidget, cls).__init_subclass__(**kwargs)
+        cls._CACHED_PROPS = cls._collectProperties()
+        cls._CACHED_PUSH_PROPS = tuple(_prop for _prop in cls._CACHED_PROPS if _prop not in cls.PUSH_SKIP_PROPERTIES)
+
     def __init__(self, parent=None, node=None, attribute=None, attributeType=None, **kwargs):
         super(BaseAttributeWidget, self).__init__(parent=parent)
 
@@ -212,24 +495,44 @@ class BaseAttributeWidget(QtWidgets.QWidget):
 
         self._node          = node
         self._attribute     = attribute
-        self._plugString    = '{}.{}'.format(self._node, self._attribute)
+        self._plugString    = sys.intern('{}.{}'.format(self._node, self._attribute))
         self._displayName   =  kwargs.get('displayName', None)
+        self._useName       = self._displayName or str(self._attribute).capitalize()
 
-        if cmds.getAttr(self._plugString, type=True) != attributeType:
+        #NOTE: A plug already resolved by the caller skips the MEL type query, see buildWidgetsForNode
+        _plug = kwargs.get('plug', None)
+        if _plug is None:
+            _plugType = cmds.getAttr(self._plugString, type=True)
+        else:
+            _plugType = _getPlugAttributeType(_plug)
+        if _plugType != attributeType:
             raise TypeError('Given Plug "{}" is of improper Given Type: {}'.format(self._plugString, attributeType))
 
         self._attributeType = attributeType
         if self._attributeType not in self.VALID_ATTR_TYPES:
             raise TypeError('Invalid attribute Type passed, type is not supported by this widget: {}'.format(attributeType))
 
+        #NOTE: Resolve the plug once, all attribute queries go through it rather than cmds.
+        #   The selection list takes any plug string getAttr does, ie element plugs "myArr[0]" and child paths
+        if _plug is None:
+            _selList = om.MSelectionList()
+            _selList.add(self._plugString)
+            self._mplug                 = _selList.getPlug(0)
+        else:
+            self._mplug                 = _plug
+
         self._isConnected               = False
         self._attributeDefaults         = self._getAttributeInformation()
         self._value                     = kwargs.get('value', self._attributeDefaults['value'])
         self._customIncrement           = kwargs.get('increment', K_FLOAT_WIDGET_STEP_INCREMENT)
 
-        self._deferredUpdateRequest     = list()
         self._nodeCallbacks             = list() 
         self._sceneAttributeData   = dict()
+        self._pendingData               = None
+        self._undoChunkOpen             = False
+        #NOTE: A chunk left open by a drag that never got its release must not outlive the widget
+        _ownerId = id(self)
+        self.destroyed.connect(lambda *args: _closeUndoChunkForOwner(_ownerId))
 
         self._buildWidget(**kwargs)
         self._setupSocketConnections()
@@ -237,6 +540,15 @@ class BaseAttributeWidget(QtWidgets.QWidget):
     def wheelEvent(self, event):
         pass
 
+    def showEvent(self, event):
+        super(BaseAttributeWidget, self).showEvent(event)
+        self._applyPendingData()
+
+    def hideEvent(self, event):
+        #NOTE: A hidden widget loses the mouse grab, its drag release may never arrive
+        self._closeUndoChunk()
+        super(BaseAttributeWidget, self).hideEvent(event)
+
     '''-------------------------
     ## Class Properties
     -------------------------'''
@@ -275,13 +587,25 @@ class BaseAttributeWidget(QtWidgets.QWidget):
         if self._sceneAttributeData:
             if not self._sceneAttributeData.get(K_OVR_PLUG_OVERRIDE_DATA_KEYS, None):
                 return 
-            _val = cmds.getAttr(self._sceneAttributeData[K_OVR_PLUG_OVERRIDE_DATA_KEYS])
+            _plugString = self._sceneAttributeData[K_OVR_PLUG_OVERRIDE_DATA_KEYS]
+        else:
+            _plugString = self._plugString
+
+        #NOTE: A queued write or an edit still in progress is newer than what is in the scene, 
+        #   don't read the plug back over it
+        if _plugString in _pendingWrites or self._hasUncommittedEdit():
+            return self._value
+
+        if self._sceneAttributeData:
+            _val = _cmdsGetAttr(_plugString)
         else:
-            _val = cmds.getAttr(self._plugString)
+            _val = _getPlugValue(self._mplug, self._attributeType)
         if not _val:
             return 
+        if self._isSameValue(_val):
+            return _val
 
-        _logger.info('_processDeferredUpdateRequest Plug -- "{}" == {}'.format(self._plugString, _val))
+        _logger.info('_processDeferredUpdateRequest Plug -- "%s" == %s', self._plugString, _val)
         self._value = _val
         self._updateWidgetValues()
         return _val
@@ -302,56 +626,72 @@ class BaseAttributeWidget(QtWidgets.QWidget):
         else:
             _plugString = self._plugString
 
-        _val = cmds.getAttr(self._plugString)   
-        try:
-            if self._attributeType == 'string':
-                cmds.setAttr(_plugString, self._value, type=self._attributeType)
-            else:
-                cmds.setAttr(_plugString, self._value)
-        except Exception as err:
-            _logger.warning(err)
-            _logger.info('Unable to set node attribute in file, Slider for "{}" is now out of sync'.format(_plugString))
-            #NOTE: we can't do the following without causing a terrible loop
-            #_curSceneVal = cmds.getAttr(self._plugString)
-            #self._value = _curSceneVal
+        #NOTE: Writes are coalesced per plug and set together on the next event loop pass, see _flushWrites
+        _queueWrite(_plugString, self._setPlugValue, self._value)
+
+    def _setPlugValue(self, plugString, val):
+        _cmdsSetAttr(plugString, val)
 
     def _onDirtyPlug(self, node, plug, *args, **kwargs):
-        '''Add to the self._deferredUpdateRequest member variable that is then 
-        deferred processed by self._processDeferredUpdateRequest(). 
+        '''Add this widget to the module pending set that is then deferred
+        processed by _processPendingWidgets(), in one batch for all widgets.
         '''
-        # get long name of the attr, to use as the dict key
-        attrName = plug.partialName(False, False, False, False, False, True)
-        # get node.attr string
-        nodePlugString = plug.partialName(True, False, False, False, False, True) 
-
-        # get node.attr string
-        nodePlugString = plug.partialName(True, False, False, False, False, True) 
+        # Add to the set of widgets to defer update
+        _pendingWidgets.add(self)
 
-        # Add to the dict of widgets to defer update
-        self._deferredUpdateRequest.append(True)
-
-        # Trigger an evalDeferred action if not already done
-        if len(self._deferredUpdateRequest) == 1:
-            cmds.evalDeferred(self._processDeferredUpdateRequest, low=True)
+        # Start the refresh timer if not already running for any widget
+        _scheduleRefresh()
 
     def _processDeferredUpdateRequest(self):
         '''Retrieve the attr value and set the widget value
         '''
-        if self._deferredUpdateRequest:
-            self._onGetAttr()
-        self._deferredUpdateRequest = list()
+        #NOTE: The scene changed after the data was pushed in, the refresh is newer than that data
+        self._pendingData = None
+        self._onGetAttr()
+
+    def _isSameValue(self, val):
+        return val == self._value
+
+    def _hasUncommittedEdit(self):
+        '''True while the widget holds a local edit that is not on the plug yet, ie mid slider drag
+        '''
+        return self._undoChunkOpen
 
     def _buildWidget(self, **kwargs):
         pass
 
+    def _openUndoChunk(self):
+        '''Group every plug edit until _closeUndoChunk into a single undo entry, ie for a slider drag
+        '''
+        if self._undoChunkOpen:
+            return
+        cmds.undoInfo(openChunk=True, chunkName=self._plugString)
+        _undoChunkOwners.add(id(self))
+        self._undoChunkOpen = True
+
+    def _closeUndoChunk(self):
+        if not self._undoChunkOpen:
+            return
+        self._undoChunkOpen = False
+        _closeUndoChunkForOwner(id(self))
+
+    def _makeLabel(self, text):
+        '''Build the right aligned name label shared by all attribute widgets
+        '''
+        _label = QtWidgets.QLabel(text)
+        _label.setScaledContents(False)
+        _label.setMinimumWidth(125)
+        _label.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignRight)
+        return _label
+
     def _setupSocketConnections(self):
         pass
 
     def _updateWidgetValues(self):
-        self.valueChanged.emit()
+        self.valueChanged.emit(self._value)
 
     def _widgetUpdated(self):
-        self.valueChanged.emit()
+        self.valueChanged.emit(self._value)
 
     def _findOverrideNodeForLayer(self, renderLayerName):
         pass
@@ -360,33 +700,36 @@ class BaseAttributeWidget(QtWidgets.QWidget):
         _attrData = dict()
         return _attrData
 
+    def _applyPendingData(self):
+        '''Apply data pushed in while the widget was hidden
+        '''
+        if self._pendingData is None:
+            return
+        _data = self._pendingData
+        self._pendingData = None
+        self._pushProperties(_data)
+
+    def _pushProperties(self, data):
+        for _prop in self._CACHED_PUSH_PROPS:
+            if _prop in data:
+                setattr(self, _prop, data[_prop])
+
     def _getAllProperties(self):
+        return self._CACHED_PROPS
+
+    @classmethod
+    def _collectProperties(cls):
         validAttrs=[]
-        localAttributes = vars(self.__class__)
-        for attr in localAttributes:
-            if attr.startswith('_'):
+        ##NOTE: Deep search for props in all parent attribute widget classes too
+        for klass in cls.__mro__:
+            if not issubclass(klass, BaseAttributeWidget):
                 continue
-            if isinstance(localAttributes[attr], types.FunctionType) or isinstance(localAttributes[attr], types.MethodType):
-                continue
-            if isinstance(localAttributes[attr], property) and attr not in self.ALWAYS_SKIP_PROPERTIES:
-                validAttrs.append(attr)
-
-        ##NOTE: This class needs a deep search for props in all parent classes too                
-        parentClasses = list(self.__class__.__bases__)
-        for parent in parentClasses:
-            parentAttributes = vars(parent)
-            for attr in parentAttributes:
-                if attr in validAttrs: 
-                    continue
-                if attr.startswith('_'):
-                    continue
-                if isinstance(parentAttributes[attr], types.FunctionType) or isinstance(parentAttributes[attr], types.MethodType):
+            for attr, attrValue in vars(klass).items():
+                if attr.startswith('_') or attr in cls.ALWAYS_SKIP_PROPERTIES:
                     continue
-                if not isinstance(parentAttributes[attr], property) or attr in self.ALWAYS_SKIP_PROPERTIES:
-                    continue
-                if attr not in validAttrs:
+                if isinstance(attrValue, property) and attr not in validAttrs:
                     validAttrs.append(attr)
-        return validAttrs
+        return tuple(validAttrs)
 
     '''-------------------------
     ## Public Methods 
@@ -394,8 +737,10 @@ class BaseAttributeWidget(QtWidgets.QWidget):
     def connectToNode(self, pull=False):
         '''Connect UI to the specified node, or override
         '''
+        #NOTE: Apply data pushed in while hidden first, otherwise the stale value is pushed to the plug
+        self._applyPendingData()
         self._nodeCallbacks = list()
-        self._deferredUpdateRequest=list()
+        _pendingWidgets.discard(self)
 
         if self._isConnected:
             #NOTE: if not set to connect or if live mode is not enabled do nothing
@@ -420,7 +765,7 @@ class BaseAttributeWidget(QtWidgets.QWidget):
             try:
                 _value = self._onGetAttr()
             except Exception as err:
-                _logger.warning('Attribute Setup Aborted Something went array when Querying the value for following plug: "{}"'.format(self._plugString))
+                _logger.warning('Attribute Setup Aborted Something went array when Querying the value for following plug: "%s"', self._plugString)
                 return 
 
             self.value = _value
@@ -431,12 +776,13 @@ class BaseAttributeWidget(QtWidgets.QWidget):
         # Note: addNodeDirtyPlugCallback better than addAttributeChangedCallback
         # for UI since the 'dirty' check will always refresh the value of the attr
         _nodeObj = _getDependNode(_node)
-        _cb = om.MNodeMessage.addNodeDirtyPlugCallback(_nodeObj, self._onDirtyPlug, None)
+        _cb = om.MNodeMessage.addNodeDirtyPlugCallback(_nodeObj, _weakDirtyPlugCallback(weakref.ref(self)), None)
         self._nodeCallbacks.append( MCallbackIdWrapper(_cb) )
 
         self._isConnected = True
 
     def disConnectFromNode(self):
+        self._closeUndoChunk()
         if not self._isConnected:
             return 
 
@@ -446,9 +792,9 @@ class BaseAttributeWidget(QtWidgets.QWidget):
         #NOTE: Set the Connected var
         self._isConnected = False
 
-        #NOTE: Then remove any callback this class may have registered
-        for _callback in self._nodeCallbacks:
-            del _callback
+        #NOTE: Then remove any callback this class may have registered, 
+        #   dropping the wrappers removes the callbacks from Maya
+        self._nodeCallbacks = list()
 
     def setLiveMode(self, state):
         if state == self.isConnected:
@@ -460,41 +806,43 @@ class BaseAttributeWidget(QtWidgets.QWidget):
             self.disConnectFromNode()
 
     def stealMyData(self):
-        _returnData=dict()
-        if self._sceneAttributeData:
-            _returnData=dict(self._sceneAttributeData)
-
-        _allProperties = self._getAllProperties()
-        for _prop in _allProperties:
-            _returnData[_prop] = getattr(self, _prop)
+        _returnData = dict(self._sceneAttributeData) if self._sceneAttributeData else dict()
+        _returnData.update({_prop: getattr(self, _prop) for _prop in self._getAllProperties()})
+        #NOTE: Data pushed in while hidden is newer than the properties, report it without applying it
+        if self._pendingData:
+            _returnData.update({_prop: self._pendingData[_prop] for _prop in self._CACHED_PUSH_PROPS if _prop in self._pendingData})
         return _returnData
 
     def pushInData(self, data):
         if not data:
+            self._pendingData = None
             self.resetToDefaultValue()
             return 
             
         self._sceneAttributeData = data
-        _allProperties = self._getAllProperties()
-        for _prop in _allProperties:
-            if _prop in self.PUSH_SKIP_PROPERTIES:
-                continue
-            if data.get(_prop, self.GARBAGE_TEST) != self.GARBAGE_TEST:
-                setattr(self, _prop, data[_prop])
-                continue
+
+        #NOTE: Hidden widgets hold on to the data until they are shown, see showEvent
+        if not self.isVisible():
+            self._pendingData = data
+            return 
+
+        self._pendingData = None
+        self._pushProperties(data)
 
     def resetToDefaultValue(self):
         if self._attributeDefaults.get('value', 'dhgwsdbsadbsdb') != 'dhgwsdbsadbsdb':
             self.value = self._attributeDefaults['value']
 
 ##  @brief String Attrribute Class Widget, with Label and lineEdit.
+#   The plug is set when editing is finished, pass "liveEcho=True" to also set it on every keystroke
 #
 class StringAttributeWidget(BaseAttributeWidget):
 
-    VALID_ATTR_TYPES = set(['string'])
+    VALID_ATTR_TYPES = frozenset(['string'])
 
 
     def __init__(self, parent=None, node=None, attribute=None, attributeType=None, **kwargs):
+        self._liveEcho = kwargs.get('liveEcho', False)
         super(StringAttributeWidget, self).__init__(
                                                     parent=parent, 
                                                     node=node, 
@@ -505,30 +853,25 @@ class StringAttributeWidget(BaseAttributeWidget):
 
     def _getAttributeInformation(self):
         _attrData = {'value':''}
-        if not cmds.objExists(str(self.plugString)):
-            return _attrData
-        _attrData['value'] = cmds.getAttr(self.plugString)
+        _attrData['value'] = self._mplug.asString()
         return _attrData
 
+    def _setPlugValue(self, plugString, val):
+        _cmdsSetAttr(plugString, val, type='string')
+
     def _buildWidget(self, **kwargs):
         _val        =   self._attributeDefaults['value']
         self._value = _val
 
-        self.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        self.setSizePolicy(_SIZE_POLICY_PREF_FIXED)
         self.main_layout = QtWidgets.QHBoxLayout()
         self.main_layout.setAlignment(QtCore.Qt.AlignCenter | QtCore.Qt.AlignCenter)
-        self.main_layout.setContentsMargins(QtCore.QMargins(0,0,0,0))
+        self.main_layout.setContentsMargins(_ZERO_MARGINS)
 
         self.setLayout(self.main_layout)
 
         #NOTE: Need a Qlabel
-        _useName = str(self._attribute).capitalize()
-        if self._displayName:
-            _useName=self._displayName
-        self._label = QtWidgets.QLabel(_useName)
-        self._label.setScaledContents(False)
-        self._label.setMinimumWidth(125)
-        self._label.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignRight)
+        self._label = self._makeLabel(self._useName)
 
         #NOTE: Need a QLineEdit
         self._lineEdit= QtWidgets.QLineEdit(self)
@@ -546,17 +889,22 @@ class StringAttributeWidget(BaseAttributeWidget):
                                         )
 
     def _setupSocketConnections(self):
-        self._lineEdit.textChanged.connect(self._widgetUpdated)
+        _uniqueConnect(self._lineEdit.editingFinished, self._widgetUpdated)
+        if self._liveEcho:
+            _uniqueConnect(self._lineEdit.textChanged, self._widgetUpdated)
 
     def _updateWidgetValues(self):
         if self._value != self._lineEdit.text():
-            self._lineEdit.textChanged.disconnect(self._widgetUpdated)
+            _blocker = QtCore.QSignalBlocker(self._lineEdit)
             self._lineEdit.setText(self._value)
-            self._lineEdit.textChanged.connect(self._widgetUpdated)
+            _blocker.unblock()
         super(StringAttributeWidget, self)._updateWidgetValues()
 
     def _widgetUpdated(self):
-        self._value = self._lineEdit.text()
+        _text = self._lineEdit.text()
+        if _text == self._value:
+            return
+        self._value = _text
         self._onSetAttr()
         super(StringAttributeWidget, self)._widgetUpdated()
 
@@ -565,7 +913,7 @@ class StringAttributeWidget(BaseAttributeWidget):
 #
 class EnumAttributeWidget(BaseAttributeWidget):
 
-    VALID_ATTR_TYPES = set(['enum'])
+    VALID_ATTR_TYPES = frozenset(['enum'])
 
     def __init__(self, parent=None, node=None, attribute=None, attributeType=None, **kwargs):
         self._enumValues = kwargs.get('enumStrings', list())
@@ -585,23 +933,17 @@ class EnumAttributeWidget(BaseAttributeWidget):
         if not isinstance(val, list):
             raise TypeError('Unable to set enumValues with anything other than a list')
         if val != self._enumValues:
-            for _idx in xrange(self._comboBox.count()-1):
-                self._comboBox.removeItem(_idx)
+            _blocker = QtCore.QSignalBlocker(self._comboBox)
+            self._comboBox.clear()
             self._comboBox.addItems(val)
-            self._enumValues = val
-            self._comboBox.addItems(self._enumValues)
             self._comboBox.setCurrentIndex(self.value)
+            _blocker.unblock()
+            self._enumValues = val
 
     def _getAttributeInformation(self):
         _attrData = {'value':False}
-        if not cmds.objExists(str(self.plugString)):
-            return _attrData
-
-        _existingEnums = cmds.attributeQuery(self.attribute, node=self.node, listEnum=True)
-        _enumStrings = _existingEnums[0].split(':')
-        _attrData['enumStrings'] = _enumStrings
-        
-        _attrData['value'] = cmds.getAttr(self.plugString)
+        _attrData['enumStrings'] = _getEnumFieldNames(self._mplug)
+        _attrData['value'] = self._mplug.asInt()
         return _attrData
 
     def _buildWidget(self, **kwargs):
@@ -610,21 +952,15 @@ class EnumAttributeWidget(BaseAttributeWidget):
         self._value = _val
         self._enumValues = self._attributeDefaults['enumStrings']
 
-        self.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        self.setSizePolicy(_SIZE_POLICY_PREF_FIXED)
         self.main_layout = QtWidgets.QHBoxLayout()
         self.main_layout.setAlignment(QtCore.Qt.AlignCenter | QtCore.Qt.AlignCenter)
-        self.main_layout.setContentsMargins(QtCore.QMargins(0,0,0,0))
+        self.main_layout.setContentsMargins(_ZERO_MARGINS)
 
         self.setLayout(self.main_layout)
 
         #NOTE: Need a Qlabel
-        _useName = str(self._attribute).capitalize()
-        if self._displayName:
-            _useName=self._displayName
-        self._label = QtWidgets.QLabel(_useName)
-        self._label.setScaledContents(False)
-        self._label.setMinimumWidth(125)
-        self._label.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignRight)
+        self._label = self._makeLabel(self._useName)
 
         #NOTE: Need a QComboBox
         self._comboBox = CustomQComboBox(self)
@@ -636,15 +972,15 @@ class EnumAttributeWidget(BaseAttributeWidget):
         self.main_layout.addSpacerItem(QtWidgets.QSpacerItem(10, 10, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding))
 
     def _setupSocketConnections(self):
-        self._comboBox.currentIndexChanged.connect(self._widgetUpdated)
+        _uniqueConnect(self._comboBox.currentIndexChanged, self._widgetUpdated)
 
     def _silentUpdateSelf(self):
-            self._comboBox.currentIndexChanged.disconnect(self._widgetUpdated)
-            self._comboBox.setCurrentIndex(self._value)
-            self._comboBox.currentIndexChanged.connect(self._widgetUpdated)
+        _blocker = QtCore.QSignalBlocker(self._comboBox)
+        self._comboBox.setCurrentIndex(self._value)
+        _blocker.unblock()
 
     def _updateWidgetValues(self):
-        self._silentUpdateSelf
+        self._silentUpdateSelf()
         super(EnumAttributeWidget, self)._updateWidgetValues()
 
     def _widgetUpdated(self):
@@ -658,7 +994,7 @@ class EnumAttributeWidget(BaseAttributeWidget):
 class FloatNumericSimpleAttributeWidget(BaseAttributeWidget):
 
     IS_SIMPLE = True
-    VALID_ATTR_TYPES = set(['doubleLinear','double','float','time','doubleAngle'])
+    VALID_ATTR_TYPES = frozenset(['doubleLinear','double','float','time','doubleAngle'])
 
     def __init__(self, parent=None, node=None, attribute=None, attributeType=None, **kwargs):
         super(FloatNumericSimpleAttributeWidget, self).__init__(
@@ -671,24 +1007,11 @@ class FloatNumericSimpleAttributeWidget(BaseAttributeWidget):
 
     def _getAttributeInformation(self):
         _attrData = dict(K_FLOAT_ATTR_DEFAULTS)
-        if not cmds.objExists(str(self.plugString)):
-            return _attrData
-
-        _tempValue = cmds.getAttr(self.plugString)
+        _tempValue = _getPlugValue(self._mplug, self._attributeType)
         if _tempValue:
             _attrData['value'] = _tempValue
 
-        if cmds.attributeQuery(self.attribute, node=self.node, minExists=True):
-            _attrData['minimum'] = cmds.attributeQuery(self.attribute, node=self.node, minimum=True)[0]
-
-        if cmds.attributeQuery(self.attribute, node=self.node, maxExists=True):
-            _attrData['maximum'] = cmds.attributeQuery(self.attribute, node=self.node, maximum=True)[0]
-
-        ##NOTE: Use this to limit the slider ranges
-        if cmds.attributeQuery(self.attribute, node=self.node, softRangeExists=True):
-            _attrData['softRange'] = cmds.attributeQuery(self.attribute, node=self.node, softRange=True)
-
-        return _attrData
+        return _updateRangeInformation(_attrData, self._mplug)
 
     def _buildWidget(self, **kwargs):
 
@@ -697,46 +1020,70 @@ class FloatNumericSimpleAttributeWidget(BaseAttributeWidget):
         _min    =   self._attributeDefaults.get('minimum', None)
         _max    =   self._attributeDefaults.get('maximum', None)
 
-        self.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        self.setSizePolicy(_SIZE_POLICY_PREF_FIXED)
         self.main_layout = QtWidgets.QHBoxLayout()
         self.main_layout.setAlignment(QtCore.Qt.AlignCenter | QtCore.Qt.AlignCenter)
-        self.main_layout.setContentsMargins(QtCore.QMargins(0,0,0,0))
+        self.main_layout.setContentsMargins(_ZERO_MARGINS)
         self.setLayout(self.main_layout)
 
         ##  NOTE:   Need a Qlabel
         if not kwargs.get('noLabel', False):
-            _useName = str(self._attribute).capitalize()
-            if self._displayName:
-                _useName=self._displayName
-            self._label = QtWidgets.QLabel(_useName)
-            self._label.setScaledContents(False)
-            self._label.setMinimumWidth(125)
-            self._label.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignRight)
+            self._label = self._makeLabel(self._useName)
             self.main_layout.addWidget(self._label)
 
         ##  NOTE:   Need a QSpinBox
         self._spinBox = CustomQDoubleSpinBox(self)
         self._spinBox.setMinimumWidth(75)
-        self._spinBox.setValue(_val)
-        self._spinBox.setMinimum(_min)
-        self._spinBox.setMaximum(_max)
         self._spinBox.setDecimals(3)
         self._spinBox.ButtonSymbols(QtWidgets.QAbstractSpinBox.PlusMinus)
+        #NOTE: Range and step first so the value is only set, and clamped, once
+        _blocker = QtCore.QSignalBlocker(self._spinBox)
+        self._spinBox.setMinimum(_min)
+        self._spinBox.setMaximum(_max)
         self._spinBox.setSingleStep(self._customIncrement)
+        self._spinBox.setValue(_val)
+        _blocker.unblock()
         self.main_layout.addWidget(self._spinBox)
 
+        ##  NOTE:   Spinbox edits are set on the plug once they settle, or when editing is finished
+        self._writePending = False
+        self._writeTimer = QtCore.QTimer(self)
+        self._writeTimer.setSingleShot(True)
+        self._writeTimer.setInterval(K_FLOAT_WIDGET_WRITE_INTERVAL)
+
     def _setupSocketConnections(self):
         ##  NOTE:   Create the commands to link the slider and double spinbox values
-        self._spinBox.valueChanged.connect(self._spinBoxUpdated)
+        _uniqueConnect(self._spinBox.valueChanged, self._spinBoxUpdated)
+        _uniqueConnect(self._spinBox.editingFinished, self._flushWrite)
+        _uniqueConnect(self._writeTimer.timeout, self._flushWrite)
 
     def _spinBoxUpdated(self, val):
+        if val == self._value:
+            return
         self._value = val
+        self._writePending = True
+        self._writeTimer.start()
+
+    def _flushWrite(self):
+        self._writeTimer.stop()
+        if not self._writePending:
+            return
+        self._writePending = False
         self._widgetUpdated()
 
+    def _isSameValue(self, val):
+        return abs(val - self._value) < K_FLOAT_VALUE_TOLERANCE
+
+    def _hasUncommittedEdit(self):
+        #NOTE: A spinbox edit waiting on the write timer is not on the plug yet
+        if self._writePending:
+            return True
+        return super(FloatNumericSimpleAttributeWidget, self)._hasUncommittedEdit()
+
     def _silentSpinBoxUpdate(self, val):
-        self._spinBox.valueChanged.disconnect(self._spinBoxUpdated)
+        _blocker = QtCore.QSignalBlocker(self._spinBox)
         self._spinBox.setValue(val)
-        self._spinBox.valueChanged.connect(self._spinBoxUpdated)
+        _blocker.unblock()
 
     def _updateWidgetValues(self):
         if self._value != self._spinBox.value():
@@ -754,6 +1101,10 @@ class FloatNumericAttributeWidget(FloatNumericSimpleAttributeWidget, BaseAttribu
 
     IS_SIMPLE = False
 
+    ##  NOTE:   Slider scale factor and its reciprocal, computed once for the slider hot paths
+    _FACTOR = float(K_FLOAT_WIDGET_FACTOR)
+    _INV_FACTOR = 1.0 / _FACTOR
+
     def __init__(self, parent=None, node=None, attribute=None, attributeType=None, **kwargs):
         super(FloatNumericAttributeWidget, self).__init__(
                                                         parent=parent, 
@@ -768,56 +1119,99 @@ class FloatNumericAttributeWidget(FloatNumericSimpleAttributeWidget, BaseAttribu
 
         _val    =   self._attributeDefaults['value']
         _range  =   [
-                    (self._attributeDefaults['minimum'] * float(K_FLOAT_WIDGET_FACTOR)), 
-                    (self._attributeDefaults['maximum'] * float(K_FLOAT_WIDGET_FACTOR))
+                    (self._attributeDefaults['minimum'] * self._FACTOR), 
+                    (self._attributeDefaults['maximum'] * self._FACTOR)
                     ]
 
         ##  NOTE:   Need a Float Slider
         self._slider = CustomQSlider(self)
         self._slider.setTickPosition(QtWidgets.QSlider.TicksBothSides)
-        self._slider.setValue(_val)
+        self._slider.setTickInterval(self._customIncrement)
+        _blocker = QtCore.QSignalBlocker(self._slider)
         self._slider.setMinimum(_range[0])
         self._slider.setMaximum(_range[1])
-        self._slider.setTickInterval(self._customIncrement)
         self._slider.setSingleStep(self._customIncrement)
+        self._slider.setValue(_val)
+        _blocker.unblock()
         self._slider.setOrientation(QtCore.Qt.Horizontal)
         self.main_layout.addWidget(self._slider)
 
+        ##  NOTE:   Slider drags are set on the plug at most once per commit interval
+        self._commitTimer = QtCore.QTimer(self)
+        self._commitTimer.setSingleShot(True)
+        self._commitTimer.setInterval(K_SLIDER_COMMIT_INTERVAL)
+        self._pressValue = None
+
     def _setupSocketConnections(self):
         super(FloatNumericAttributeWidget, self)._setupSocketConnections()
-        self._slider.valueChanged.connect(self._sliderUpdated)
+        ##  NOTE:   valueChanged only previews while dragging, the plug is set once the slider is released
+        _uniqueConnect(self._slider.valueChanged, self._sliderPreview)
+        _uniqueConnect(self._slider.sliderPressed, self._sliderPressed)
+        _uniqueConnect(self._slider.sliderReleased, self._sliderCommit)
+        _uniqueConnect(self._commitTimer.timeout, self._commitValue)
 
-        ##  NOTE:   Need to set values to make sure connection update is in sync
-        self._spinBox.setValue((self._attributeDefaults['value'] + 1))
-        self._spinBox.setValue(self._attributeDefaults['value'])
+        ##  NOTE:   Sync the slider to the starting value, without going through the setAttr path
+        self._silentSliderUpdate(int(round(self._attributeDefaults['value'] * self._FACTOR)))
 
     def _spinBoxUpdated(self, val):
-        self._silentSliderUpdate(val)
+        self._silentSliderUpdate(int(round(val * self._FACTOR)))
         super(FloatNumericAttributeWidget, self)._spinBoxUpdated(val)
 
-    def _sliderUpdated(self, val):
+    def _sliderPreview(self, val):
         #NOTE: Need to update the slider along with any connections, but not trigger any connections
-        self._value = val / float(K_FLOAT_WIDGET_FACTOR)
+        _newVal = val * self._INV_FACTOR
+        if _newVal == self._value:
+            return
+        self._value = _newVal
         self._silentSpinBoxUpdate(self._value)
+
+        #NOTE: Drags are committed by _sliderCommit, keyboard and page steps through the commit timer
+        if self._slider.isSliderDown():
+            return
+        if not self._commitTimer.isActive():
+            self._commitTimer.start()
+
+    def _commitValue(self):
+        self._commitTimer.stop()
         self._widgetUpdated()
 
+    def _sliderPressed(self):
+        self._pressValue = self._value
+        self._openUndoChunk()
+
+    def _hasUncommittedEdit(self):
+        if self._slider.isSliderDown() or self._commitTimer.isActive():
+            return True
+        return super(FloatNumericAttributeWidget, self)._hasUncommittedEdit()
+
+    def _sliderCommit(self):
+        #NOTE: Set the dragged value before closing the drag's undo chunk, 
+        #   a click that leaves the value unchanged sets nothing
+        if self._commitTimer.isActive() or self._value != self._pressValue:
+            self._commitValue()
+        self._closeUndoChunk()
+
+    ##  @brief Sets the slider without triggering any connections
+    #   @param val [int] - slider position, already scaled by _FACTOR
+    #
     def _silentSliderUpdate(self, val):
-        #NOTE: Need to update the spinBox along with any connections, but not trigger any connections
-        self._slider.valueChanged.disconnect(self._sliderUpdated)
-        self._slider.setValue(val * float(K_FLOAT_WIDGET_FACTOR))
-        self._slider.valueChanged.connect(self._sliderUpdated)
+        _blocker = QtCore.QSignalBlocker(self._slider)
+        self._slider.setValue(int(val))
+        _blocker.unblock()
 
     def _updateWidgetValues(self):
         super(FloatNumericAttributeWidget, self)._updateWidgetValues()
-        if self._value != (self._slider.value() / float(K_FLOAT_WIDGET_FACTOR)):
-            self._silentSliderUpdate(self._value * float(K_FLOAT_WIDGET_FACTOR))
+        #NOTE: Compare in slider units, dividing the slider value back out differs from _value by ULPs
+        _target = int(round(self._value * self._FACTOR))
+        if _target != self._slider.value():
+            self._silentSliderUpdate(_target)
 
 ##  @brief Integer Attibute Class Has an optional Label, and a QSpinBox that controls Integer Attributes 
 #
 class IntegerNumericSimpleAttributeWidget(BaseAttributeWidget):
 
     IS_SIMPLE = True
-    VALID_ATTR_TYPES = set(['long', 'short', 'byte'])
+    VALID_ATTR_TYPES = frozenset(['long', 'short', 'byte'])
 
     def __init__(self, parent=None, node=None, attribute=None, attributeType=None, **kwargs):
         super(IntegerNumericSimpleAttributeWidget, self).__init__(
@@ -830,24 +1224,11 @@ class IntegerNumericSimpleAttributeWidget(BaseAttributeWidget):
 
     def _getAttributeInformation(self):
         _attrData = dict(K_INTEGER_ATTR_DEFAULTS)
-        if not cmds.objExists(str(self.plugString)):
-            return _attrData
-
-        _tempValue = cmds.getAttr(self.plugString)
+        _tempValue = _getPlugValue(self._mplug, self._attributeType)
         if _tempValue:
             _attrData['value'] = _tempValue
 
-        if cmds.attributeQuery(self.attribute, node=self.node, minExists=True):
-            _attrData['minimum'] = cmds.attributeQuery(self.attribute, node=self.node, minimum=True)[0]
-
-        if cmds.attributeQuery(self.attribute, node=self.node, maxExists=True):
-            _attrData['maximum'] = cmds.attributeQuery(self.attribute, node=self.node, maximum=True)[0]
-
-        ##NOTE: Use this to limit the slider ranges
-        if cmds.attributeQuery(self.attribute, node=self.node, softRangeExists=True):
-            _attrData['softRange'] = cmds.attributeQuery(self.attribute, node=self.node, softRange=True)
-
-        return _attrData
+        return _updateRangeInformation(_attrData, self._mplug)
 
     def _buildWidget(self, **kwargs):
         _val = int(self._attributeDefaults['value'])
@@ -857,48 +1238,46 @@ class IntegerNumericSimpleAttributeWidget(BaseAttributeWidget):
         _range = [int(self._attributeDefaults['softRange'][0]), int(self._attributeDefaults['softRange'][1])]
 
 
-        self.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        self.setSizePolicy(_SIZE_POLICY_PREF_FIXED)
         self.main_layout = QtWidgets.QHBoxLayout()
         self.main_layout.setAlignment(QtCore.Qt.AlignCenter | QtCore.Qt.AlignCenter)
-        self.main_layout.setContentsMargins(QtCore.QMargins(0,0,0,0))
+        self.main_layout.setContentsMargins(_ZERO_MARGINS)
 
         self.setLayout(self.main_layout)
 
         if not kwargs.get('noLabel', False):
         #NOTE: Need a Qlabel
-            _useName = str(self._attribute).capitalize()
-            if self._displayName:
-                _useName=self._displayName
-            self._label = QtWidgets.QLabel(_useName)
-            self._label.setScaledContents(False)
-            self._label.setMinimumWidth(125)
-            self._label.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignRight)
+            self._label = self._makeLabel(self._useName)
             self.main_layout.addWidget(self._label)
 
         #NOTE: Need a SpinBox
         self._spinBox = CustomQSpinBox(self)
         self._spinBox.setMinimumWidth(75)
-        self._spinBox.setValue(_val)
+        self._spinBox.ButtonSymbols(QtWidgets.QAbstractSpinBox.PlusMinus)
+        #NOTE: Range and step first so the value is only set, and clamped, once
+        _blocker = QtCore.QSignalBlocker(self._spinBox)
         self._spinBox.setMinimum(_min)
         self._spinBox.setMaximum(_max)
-        self._spinBox.ButtonSymbols(QtWidgets.QAbstractSpinBox.PlusMinus)
         self._spinBox.setSingleStep(int(K_INTEGER_WIDGET_STEP_INCREMENT))
         self._spinBox.setValue(_val)
+        _blocker.unblock()
 
         self.main_layout.addWidget(self._spinBox)
 
     def _setupSocketConnections(self):
-        self._spinBox.valueChanged.connect(self._spinBoxUpdated)
+        _uniqueConnect(self._spinBox.valueChanged, self._spinBoxUpdated)
 
     def _spinBoxUpdated(self, val):
         #NOTE: Need to update the slider along with any connections, but not trigger any connections
+        if val == self._value:
+            return
         self._value = val
         self._widgetUpdated()
         
     def _silentSpinBoxUpdate(self, val):
-        self._spinBox.valueChanged.disconnect(self._spinBoxUpdated)
+        _blocker = QtCore.QSignalBlocker(self._spinBox)
         self._spinBox.setValue(val)
-        self._spinBox.valueChanged.connect(self._spinBoxUpdated)
+        _blocker.unblock()
 
     def _updateWidgetValues(self):
         if self._value != self._spinBox.value():
@@ -935,33 +1314,72 @@ class IntegerNumericAttributeWidget(IntegerNumericSimpleAttributeWidget, BaseAtt
         self._slider = CustomQSlider(self)
         self._slider.setTickPosition(QtWidgets.QSlider.TicksBothSides)
         self._slider.setTickInterval(int(K_INTEGER_WIDGET_STEP_INCREMENT))
-        self._slider.setValue(_val)
+        _blocker = QtCore.QSignalBlocker(self._slider)
         self._slider.setMinimum(_min)
         self._slider.setMaximum(_max)
         self._slider.setSingleStep(int(K_INTEGER_WIDGET_STEP_INCREMENT))
+        self._slider.setValue(_val)
+        _blocker.unblock()
         
         #NOTE: the slider should expand indefinently to the right
         self._slider.setOrientation(QtCore.Qt.Horizontal)
 
         self.main_layout.addWidget(self._slider)
 
+        #NOTE: Slider drags are set on the plug at most once per commit interval
+        self._commitTimer = QtCore.QTimer(self)
+        self._commitTimer.setSingleShot(True)
+        self._commitTimer.setInterval(K_SLIDER_COMMIT_INTERVAL)
+        self._pressValue = None
+
     def _setupSocketConnections(self):
         super(IntegerNumericAttributeWidget, self)._setupSocketConnections()
-        self._slider.valueChanged.connect(self._sliderUpdated)
+        #NOTE: valueChanged only previews while dragging, the plug is set once the slider is released
+        _uniqueConnect(self._slider.valueChanged, self._sliderPreview)
+        _uniqueConnect(self._slider.sliderPressed, self._sliderPressed)
+        _uniqueConnect(self._slider.sliderReleased, self._sliderCommit)
+        _uniqueConnect(self._commitTimer.timeout, self._commitValue)
 
     def _spinBoxUpdated(self, val):
         self._silentSliderUpdate(val)
         super(IntegerNumericAttributeWidget, self)._spinBoxUpdated(val)
 
-    def _sliderUpdated(self, val):
+    def _sliderPreview(self, val):
+        if val == self._value:
+            return
         self._silentSpinBoxUpdate(val)
         self._value = val
+
+        #NOTE: Drags are committed by _sliderCommit, keyboard and page steps through the commit timer
+        if self._slider.isSliderDown():
+            return
+        if not self._commitTimer.isActive():
+            self._commitTimer.start()
+
+    def _commitValue(self):
+        self._commitTimer.stop()
         self._widgetUpdated()
 
+    def _sliderPressed(self):
+        self._pressValue = self._value
+        self._openUndoChunk()
+
+    def _hasUncommittedEdit(self):
+        if self._slider.isSliderDown() or self._commitTimer.isActive():
+            return True
+        return super(IntegerNumericAttributeWidget, self)._hasUncommittedEdit()
+
+    def _sliderCommit(self):
+        #NOTE: Set the dragged value before closing the drag's undo chunk, 
+        #   a click that leaves the value unchanged sets nothing
+        if self._commitTimer.isActive() or self._value != self._pressValue:
+            self._commitValue()
+        self._closeUndoChunk()
+
     def _silentSliderUpdate(self, val):
-        self._slider.valueChanged.disconnect(self._sliderUpdated)
+        _blocker = QtCore.QSignalBlocker(self._slider)
         self._slider.setValue(val)
-        self._slider.valueChanged.connect(self._sliderUpdated)
+        _blocker.unblock()
 
     def _updateWidgetValues(self):
         super(IntegerNumericAttributeWidget, self)._updateWidgetValues()
@@ -973,7 +1391,7 @@ class IntegerNumericAttributeWidget(IntegerNumericSimpleAttributeWidget, BaseAtt
 #
 class BoolAttributeWidget(BaseAttributeWidget):
 
-    VALID_ATTR_TYPES = set(['bool'])
+    VALID_ATTR_TYPES = frozenset(['bool'])
 
     def __init__(self, parent=None, node=None, attribute=None, attributeType=None, **kwargs):
         super(BoolAttributeWidget, self).__init__(
@@ -986,36 +1404,34 @@ class BoolAttributeWidget(BaseAttributeWidget):
        
     def _getAttributeInformation(self):
         _attrData = {'value':False}
-        if not cmds.objExists(str(self.plugString)):
-            return _attrData
-
-        _attrData['value'] = cmds.getAttr(self.plugString)
+        _attrData['value'] = _getPlugValue(self._mplug, self._attributeType)
         return _attrData
         
     def _buildWidget(self, **kwargs):
-        self.main_layout = QtWidgets.QFormLayout()
+        self.setSizePolicy(_SIZE_POLICY_PREF_FIXED)
+        self.main_layout = QtWidgets.QHBoxLayout()
         self.main_layout.setAlignment(QtCore.Qt.AlignCenter | QtCore.Qt.AlignCenter)
+        self.main_layout.setContentsMargins(_ZERO_MARGINS)
         self.setLayout(self.main_layout)
 
-        #NOTE: Create and add a CheckBox
-        _useName = str(self._attribute).capitalize()
-        if self._displayName:
-            _useName=self._displayName
-        self._label = QtWidgets.QLabel(_useName)
-        self._label.setScaledContents(False)
-        self._label.setMinimumWidth(125)
-        self._label.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignRight)
-
-        self._checkBox = QtWidgets.QCheckBox()
+        #NOTE: The CheckBox carries the attribute name itself, no separate QLabel needed
+        self._checkBox = QtWidgets.QCheckBox(self._useName)
         self._value = self._attributeDefaults['value']
-        self.main_layout.addRow(_useName, self._checkBox)
+        _blocker = QtCore.QSignalBlocker(self._checkBox)
+        self._checkBox.setChecked(self._value)
+        _blocker.unblock()
+
+        self.main_layout.addWidget(self._checkBox)
+        self.main_layout.addSpacerItem(QtWidgets.QSpacerItem(10, 10, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding))
 
     def _setupSocketConnections(self):
-        self._checkBox.stateChanged.connect(self._widgetUpdated)
-        self._checkBox.setChecked(self._value)
+        _uniqueConnect(self._checkBox.stateChanged, self._widgetUpdated)
         
     def _updateWidgetValues(self):
-        self._checkBox.setChecked(self._value)        
+        #NOTE: Need to update the checkBox, but not trigger any connections
+        _blocker = QtCore.QSignalBlocker(self._checkBox)
+        self._checkBox.setChecked(self._value)
+        _blocker.unblock()
         super(BoolAttributeWidget, self)._updateWidgetValues()
 
     def _widgetUpdated(self):
@@ -1025,33 +1441,209 @@ class BoolAttributeWidget(BaseAttributeWidget):
         super(BoolAttributeWidget, self)._widgetUpdated()
 
 
+##  @brief Attribute type to widget class lookup used by the factory, {attributeType: {'simple': cls, 'full': cls}}
+_ATTR_DISPATCH = dict()
+
+##  @brief (Re)builds _ATTR_DISPATCH from the BaseAttributeWidget subclasses.
+#   "full" holds the first class that is not IS_SIMPLE, "simple" the first class of any kind
+#
+def _buildAttributeDispatch():
+    _ATTR_DISPATCH.clear()
+    for _attrClass in BaseAttributeWidget.__subclasses__():
+        _isSimple = getattr(_attrClass, 'IS_SIMPLE', False)
+        for _attrType in _attrClass.VALID_ATTR_TYPES:
+            _entry = _ATTR_DISPATCH.setdefault(_attrType, dict())
+            if not _isSimple:
+                _entry.setdefault('full', _attrClass)
+            _entry.setdefault('simple', _attrClass)
+
 ##  @Breif: Method for creating Attribute Widgets based on attributeTypes, and plug information
 #
 def AttributeWidgetFactory(parent=None, node=None, attribute=None, attributeType=None, **kwargs):
+    #NOTE: An attribute cache from buildAttrCache provides the plug, and the type when none is given
+    _nodeAttrCache = kwargs.get('nodeAttrCache', None)
+    _cachedAttr = _nodeAttrCache.get(attribute, None) if _nodeAttrCache else None
+    _plug = kwargs.get('plug', None)
+    if _cachedAttr:
+        attributeType = attributeType or _cachedAttr['attributeType']
+        _plug = _plug or _cachedAttr['plug']
+
     if not attributeType:
         raise TypeError('You must at least pass an attributeType into the Factory')
+    #NOTE: Interned once here so the dispatch and VALID_ATTR_TYPES lookups compare by identity
+    attributeType = sys.intern(str(attributeType))
+
+    _entry = _ATTR_DISPATCH.get(attributeType, None)
+    if _entry is None:
+        #NOTE: Rebuild on a miss, widget classes may have been defined since the last build
+        _buildAttributeDispatch()
+        _entry = _ATTR_DISPATCH.get(attributeType, None)
+    if _entry is None:
+        return None
 
-    _createdWidget=None
-
-    _allWidgetTypes = BaseAttributeWidget.__subclasses__()
-    for _attrClass in _allWidgetTypes:
-        if hasattr(_attrClass, 'IS_SIMPLE'):
-            _simpleValue = getattr(_attrClass, 'IS_SIMPLE')
-            if _simpleValue and not kwargs.get('noLabel', False):
-                _logger.info('Skipping, desire Non Simple Class: {}'.format(_attrClass))
-                continue               
-
-        if attributeType in _attrClass.VALID_ATTR_TYPES:
-            _createdWidget = _attrClass(
-                                        parent=parent, 
-                                        node=node, 
-                                        attribute=attribute,  
-                                        attributeType=str(attributeType), 
-                                        value=kwargs.get('value', 0),
-                                        displayName=kwargs.get('displayName', ''),
-                                        noLabel=kwargs.get('noLabel', False)
-                                        )
-            break                                        
-    return _createdWidget
+    _attrClass = _entry.get('simple' if kwargs.get('noLabel', False) else 'full', None)
+    if _attrClass is None:
+        return None
 
+    return _attrClass(
+                    parent=parent, 
+                    node=node, 
+                    attribute=attribute,  
+                    attributeType=attributeType, 
+                    value=kwargs.get('value', 0),
+                    displayName=kwargs.get('displayName', ''),
+                    noLabel=kwargs.get('noLabel', False),
+                    liveEcho=kwargs.get('liveEcho', False),
+                    plug=_plug
+                    )
+
+##  @brief Returns True if the attribute or any of its parents is an array (multi) attribute
+#
+def _isArrayAttribute(attrObj):
+    while not attrObj.isNull():
+        _fnAttr = om.MFnAttribute(attrObj)
+        if _fnAttr.array:
+            return True
+        attrObj = _fnAttr.parent
+    return False
+
+##  @brief Builds a snapshot of the attributes of a node for the factory, resolving the node once
+#   and every plug and attribute type through OpenMaya. Pass it to AttributeWidgetFactory as "nodeAttrCache"
+#
+#   @param node [str] - Maya node name
+#   @param attributes [list] - attribute names to cache, when None every supported attribute of the node
+#
+#   @retval [dict] - {attributeName: {'plug': MPlug, 'attributeType': str}}, 
+#       attributes that are missing, arrays or of unsupported types are left out
+#
+def buildAttrCache(node, attributes=None):
+    _attrCache = dict()
+    _nodeObj = _getDependNode(node)
+    if _nodeObj.isNull():
+        return _attrCache
+
+    _fnNode = om.MFnDependencyNode(_nodeObj)
+    _plugs = list()
+    if attributes is None:
+        for _idx in range(_fnNode.attributeCount()):
+            _attrObj = _fnNode.attribute(_idx)
+            if _isArrayAttribute(_attrObj):
+                continue
+            _plugs.append((om.MFnAttribute(_attrObj).name, om.MPlug(_nodeObj, _attrObj)))
+    else:
+        for _attribute in attributes:
+            try:
+                _plug = _fnNode.findPlug(_attribute, False)
+            except RuntimeError:
+                _logger.warning('Unable to find plug "%s.%s"', node, _attribute)
+                continue
+            if _isArrayAttribute(_plug.attribute()):
+                _logger.warning('Skipping array plug "%s.%s", array attributes are not supported', node, _attribute)
+                continue
+            _plugs.append((_attribute, _plug))
+
+    for _attribute, _plug in _plugs:
+        _attributeType = _getPlugAttributeType(_plug)
+        if not _attributeType:
+            continue
+        _attrCache[_attribute] = {'plug': _plug, 'attributeType': _attributeType}
+    return _attrCache
+
+##  @brief Method for creating Attribute Widgets for several attributes of the same node,
+#   the node is resolved once and each widget is handed its plug, so no MEL queries are made per widget
+#
+#   @param node [str] - Maya node name
+#   @param attributes [list] - attribute names to build widgets for, when None every supported attribute of the node
+#   @param parent [QWidget] - parent widget for all created widgets
+#   @param nodeAttrCache [dict] - optional cache from buildAttrCache to reuse, built here otherwise
+#
+#   @retval [list] - created widgets, attributes that are missing or of unsupported types are skipped
+#
+def buildWidgetsForNode(node, attributes=None, parent=None, **kwargs):
+    _widgets = list()
+    _nodeAttrCache = kwargs.pop('nodeAttrCache', None)
+    if _nodeAttrCache is None:
+        _nodeAttrCache = buildAttrCache(node, attributes)
+    if attributes is None:
+        attributes = list(_nodeAttrCache)
+
+    for _attribute in attributes:
+        if _attribute not in _nodeAttrCache:
+            continue
+
+        #NOTE: One failing attribute must not abort the rest of the node
+        try:
+            _widget = AttributeWidgetFactory(
+                                            parent=parent, 
+                                            node=node, 
+                                            attribute=_attribute, 
+                                            nodeAttrCache=_nodeAttrCache, 
+                                            **kwargs
+                                            )
+        except Exception as err:
+            _logger.warning('Unable to build attribute widget for plug "%s.%s": %s', node, _attribute, err)
+            continue
+        if _widget:
+            _widgets.append(_widget)
+    return _widgets
+
+##  @brief Builds attribute widgets for a node a few at a time from the event loop,
+#   so a dialog showing many attributes stays responsive while it is populated.
+#   The Maya queries stay on the main thread, neither cmds nor the Maya API are safe to call from worker threads
+#
+#   builder = AttributeWidgetBuilder(node='pSphere1', attributes=['translateX', 'visibility'], parent=myWidget)
+#   builder.widgetBuilt.connect(myLayout.addWidget)
+#   builder.start()
+#
+class AttributeWidgetBuilder(QtCore.QObject):
+
+    widgetBuilt = QtCore.Signal(object)
+    finished = QtCore.Signal()
+
+    def __init__(self, node=None, attributes=None, parent=None, batchSize=K_WIDGET_BUILD_BATCH_SIZE, **kwargs):
+        super(AttributeWidgetBuilder, self).__init__(parent=parent)
+        self._node          = node
+        self._attributes    = list(attributes or list())
+        self._batchSize     = max(1, int(batchSize))
+        self._widgetKwargs  = kwargs
+        self._widgets       = list()
+        self._nodeAttrCache = None
+        self._started       = False
+
+    @property
+    def widgets(self):
+        return self._widgets
+
+    def start(self):
+        #NOTE: A second start would run two interleaved batch chains over the same attributes
+        if self._started:
+            return
+        self._started = True
+
+        try:
+            self._nodeAttrCache = buildAttrCache(self._node, self._attributes or None)
+        except Exception as err:
+            _logger.warning('Unable to read the attributes of node "%s": %s', self._node, err)
+            self._nodeAttrCache = dict()
+            self._attributes = list()
+        if not self._attributes:
+            self._attributes = list(self._nodeAttrCache)
+        QtCore.QTimer.singleShot(0, self._buildNextBatch)
+
+    def _buildNextBatch(self):
+        _batch = self._attributes[:self._batchSize]
+        del self._attributes[:self._batchSize]
+
+        #NOTE: Keep the chain going whatever happens in a batch, callers wait on finished
+        try:
+            for _widget in buildWidgetsForNode(self._node, _batch, parent=self.parent(), nodeAttrCache=self._nodeAttrCache, **self._widgetKwargs):
+                self._widgets.append(_widget)
+                self.widgetBuilt.emit(_widget)
+        except Exception as err:
+            _logger.warning('Unable to build attribute widgets for node "%s": %s', self._node, err)
+        finally:
+            if self._attributes:
+                QtCore.QTimer.singleShot(0, self._buildNextBatch)
+            else:
+                self.finished.emit()
 